@@ -62,6 +62,7 @@ class BuildOrchestrator:
         data_cache: DataCache[Message],
         page_builder: PageBuilder,
         html_generators: Dict[str, HtmlBlockGenerator],
+        root_dir: str = ".",
     ):
         """Initializes the BuildOrchestrator with necessary service components.
 
@@ -77,6 +78,9 @@ class BuildOrchestrator:
             page_builder: Assembles the final HTML page from various parts.
             html_generators: A dictionary mapping block names to their
                 respective HTML generator instances.
+            root_dir: The directory that configuration, data and output
+                paths are resolved against. Defaults to the current
+                working directory.
         """
         self.app_config_manager = app_config_manager
         self.translation_provider = translation_provider
@@ -84,19 +88,27 @@ class BuildOrchestrator:
         self.data_cache = data_cache
         self.page_builder = page_builder
         self.html_generators = html_generators
+        self.root_dir = root_dir
 
         self.app_config: Dict[str, Any] = {}
         self.nav_proto_data: Optional[Navigation] = None
+        # Static blocks are language-independent, so each file is read once
+        # per build and reused for every language. Cleared by
+        # build_all_languages() at the start of each build.
+        self._static_block_cache: Dict[str, str] = {}
 
     def load_initial_configurations(self) -> None:
         """Loads base configurations like app config and navigation data.
 
         This method populates `self.app_config` and `self.nav_proto_data`.
         """
-        self.app_config = self.app_config_manager.load_app_config()
+        self.app_config = self.app_config_manager.load_app_config(
+            os.path.join(self.root_dir, "public", "config.json")
+        )
 
-        nav_data_file = self.app_config.get(
-            "navigation_data_file", "data/navigation.json"
+        nav_data_file = os.path.join(
+            self.root_dir,
+            self.app_config.get("navigation_data_file", "data/navigation.json"),
         )
         # The DataLoader is generic (Message), but here we expect Navigation.
         # A type: ignore is used as the generic loader's signature doesn't
@@ -139,7 +151,9 @@ class BuildOrchestrator:
         if lang == default_lang:
             output_filename = "index.html"
 
-        self._write_output_file(output_filename, full_html_content)
+        self._write_output_file(
+            os.path.join(self.root_dir, output_filename), full_html_content
+        )
 
     def build_all_languages(self) -> None:
         """Builds pages for all supported languages.
@@ -148,6 +162,8 @@ class BuildOrchestrator:
         It orchestrates loading, data preloading, and iterates through each
         supported language to generate the respective HTML output.
         """
+        # Start from a fresh cache so a rebuild picks up edited block files.
+        self._static_block_cache.clear()
         self.load_initial_configurations()
 
         supported_langs: List[str] = self.app_config.get(
@@ -189,13 +205,20 @@ class BuildOrchestrator:
             # Create a new config dict for resolved types to avoid modifying original app_config
             resolved_item_config = config_item.copy()
             resolved_item_config["message_type"] = message_type_class
+            if "data_file" in resolved_item_config:
+                resolved_item_config["data_file"] = os.path.join(
+                    self.root_dir, resolved_item_config["data_file"]
+                )
             dynamic_data_loaders_config_resolved[block_name] = resolved_item_config
 
         self.data_cache.preload_data(
             dynamic_data_loaders_config_resolved, self.data_loader
         )
 
-        os.makedirs("public/generated_configs", exist_ok=True)
+        os.makedirs(
+            os.path.join(self.root_dir, "public", "generated_configs"),
+            exist_ok=True,
+        )
 
         # Process navigation data into the format expected by the template
         processed_nav_items = []
@@ -242,7 +265,9 @@ class BuildOrchestrator:
             translations=translations,
             lang=lang,
         )
-        generated_config_path = f"public/generated_configs/config_{lang}.json"
+        generated_config_path = os.path.join(
+            self.root_dir, "public", "generated_configs", f"config_{lang}.json"
+        )
         try:
             with open(generated_config_path, "w", encoding="utf-8") as config_file:
                 json.dump(
@@ -352,13 +377,23 @@ class BuildOrchestrator:
                     # Let's replicate that if no generator is found but block is in config.
                     # This means the block is treated as mostly static HTML but with i18n tags.
                     try:
-                        block_template_path = os.path.join(
-                            "templates", "blocks", block_file_name
-                        )  # new path
-                        with open(
-                            block_template_path, "r", encoding="utf-8"
-                        ) as block_file:
-                            static_block_content = block_file.read()
+                        static_block_content = self._static_block_cache.get(
+                            block_file_name
+                        )
+                        if static_block_content is None:
+                            block_template_path = os.path.join(
+                                self.root_dir,
+                                "templates",
+                                "blocks",
+                                block_file_name,
+                            )  # new path
+                            with open(
+                                block_template_path, "r", encoding="utf-8"
+                            ) as block_file:
+                                static_block_content = block_file.read()
+                            self._static_block_cache[block_file_name] = (
+                                static_block_content
+                            )
                         generated_html_for_block = static_block_content
                         print(
                             f"Info: Treating block {block_file_name} as static HTML for translation only."
@@ -430,22 +465,33 @@ class BuildOrchestrator:
             print(f"Error writing file {filename}: {e}")
 
 
-def main() -> None:
+def main(root_dir: str = ".") -> None:
     """Initializes services and runs the build orchestrator.
 
     This function sets up all the necessary components (managers, providers,
     loaders, etc.) and then invokes the BuildOrchestrator to perform the
     website build.
+
+    Args:
+        root_dir: The directory containing the site sources (`public/`,
+            `data/`, `templates/`) and receiving the generated pages.
+            Defaults to the current working directory.
     """
     # Initialize Jinja2 Environment
+    # Templates do not change during a build, so skip the per-lookup
+    # modification check and keep every compiled template for all languages.
     jinja_env = Environment(
-        loader=FileSystemLoader("templates"),
+        loader=FileSystemLoader(os.path.join(root_dir, "templates")),
         autoescape=True,  # Enable autoescaping
+        auto_reload=False,
+        cache_size=-1,
     )
 
     # Instantiate service components with more descriptive names
     app_config_manager_instance = DefaultAppConfigManager()
-    translation_provider_instance = DefaultTranslationProvider()
+    translation_provider_instance = DefaultTranslationProvider(
+        locales_dir=os.path.join(root_dir, "public", "locales")
+    )
     # Note: JsonProtoDataLoader and InMemoryDataCache are generic.
     # We specify Message here as they will handle various protobuf message types.
     data_loader_instance = JsonProtoDataLoader[Message]()
@@ -471,6 +517,7 @@ def main() -> None:
         data_cache=data_cache_instance,
         page_builder=page_builder_instance,
         html_generators=html_generator_instances,
+        root_dir=root_dir,
     )
     orchestrator.build_all_languages()
 
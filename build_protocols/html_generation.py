@@ -9,9 +9,9 @@ and produces an HTML string representation for that block.
 """
 
 import random
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 
 # Generated protobuf message types
 from generated.blog_post_pb2 import BlogPost
@@ -60,6 +60,21 @@ class BaseHtmlGenerator(HtmlBlockGenerator):
 
     def __init__(self, jinja_env: Environment):
         self.jinja_env = jinja_env
+        self._template: Optional[Template] = None
+
+    def _get_template(self) -> Template:
+        """
+        Returns the compiled template for this generator, loading it on first use.
+
+        The compiled template is kept on the instance so that repeated renders
+        (e.g. once per language) skip the environment's loader lookup and
+        up-to-date check.
+        """
+        if self._template is None:
+            self._template = self.jinja_env.get_template(
+                self.__class__.template_to_render
+            )
+        return self._template
 
     def generate_html(self, data: Any, translations: Translations) -> str:
         """
@@ -82,7 +97,7 @@ class BaseHtmlGenerator(HtmlBlockGenerator):
                 f"template_to_render not set for {self.__class__.__name__}"
             )
 
-        template = self.jinja_env.get_template(self.__class__.template_to_render)
+        template = self._get_template()
 
         context = {
             self.__class__.data_key_for_template: data,
@@ -168,7 +183,21 @@ class FeaturesHtmlGenerator(BaseHtmlGenerator):
 class HeroHtmlGenerator(BaseHtmlGenerator):
     """Generates HTML for a hero section using Jinja2."""
 
-    # __init__ is inherited from BaseHtmlGenerator
+    def __init__(
+        self,
+        jinja_env: Environment,
+        choose: Callable[[Sequence[HeroItemContent]], HeroItemContent] = random.choice,
+    ):
+        """Initializes the generator.
+
+        Args:
+            jinja_env: The Jinja2 environment used to load the hero template.
+            choose: Picks a variation when no default variation matches.
+                Defaults to `random.choice`; pass a deterministic function to
+                make the selection reproducible.
+        """
+        super().__init__(jinja_env)
+        self.choose = choose
 
     # generate_html is custom due to variation logic
     def generate_html(
@@ -200,9 +229,9 @@ class HeroHtmlGenerator(BaseHtmlGenerator):
         if (
             not selected_variation
         ):  # Already know data.variations is not empty from the guard clause
-            selected_variation = random.choice(data.variations)
+            selected_variation = self.choose(data.variations)
 
-        template = self.jinja_env.get_template(self.__class__.template_to_render)
+        template = self._get_template()
         # The template expects `hero_item` as the context variable for the selected variation
         return str(
             template.render(hero_item=selected_variation, translations=translations)
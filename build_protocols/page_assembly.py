@@ -9,7 +9,7 @@ main content, and language-specific attributes to form a complete HTML page.
 import logging
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 
 from .interfaces import PageBuilder, TranslationProvider, Translations
 
@@ -40,6 +40,7 @@ class DefaultPageBuilder(PageBuilder):
         """
         self.translation_provider = translation_provider
         self.jinja_env = jinja_env
+        self._base_template: Optional[Template] = None
 
     def assemble_translated_page(
         self,
@@ -65,7 +66,11 @@ class DefaultPageBuilder(PageBuilder):
         Returns:
             The complete HTML string for the translated page.
         """
-        base_template = self.jinja_env.get_template("base.html")
+        # The base template is shared by every language, so it is resolved
+        # once and reused for subsequent pages.
+        if self._base_template is None:
+            self._base_template = self.jinja_env.get_template("base.html")
+        base_template = self._base_template
 
         context = {
             "lang": lang,
@@ -12,7 +12,8 @@ methods from a default provider instance.
 
 import json
 import logging
-from typing import List, Union
+import os
+from typing import IO, Callable, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
@@ -32,6 +33,27 @@ class DefaultTranslationProvider(TranslationProvider):
     `data-i18n="translation_key"` attributes.
     """
 
+    def __init__(
+        self,
+        locales_dir: str = "public/locales",
+        opener: Optional[Callable[..., IO[str]]] = None,
+    ) -> None:
+        """Initializes the provider.
+
+        Args:
+            locales_dir: The directory containing the `{lang}.json` translation
+                files. Relative paths are resolved against the current working
+                directory.
+            opener: Opens a translation file for reading; called like `open`
+                with the path, mode and encoding. Defaults to the built-in
+                `open`, looked up at call time so patching it still applies;
+                pass a function returning e.g. `io.StringIO` to supply
+                translations without files.
+        """
+        self.locales_dir = locales_dir
+        self.opener = opener
+        self._translations_cache: Dict[str, Translations] = {}
+
     def _get_attribute_value_as_str(self, element: Tag, attr_name: str) -> str:
         """Safely retrieves an attribute value as a string.
 
@@ -58,7 +80,10 @@ class DefaultTranslationProvider(TranslationProvider):
     def load_translations(self, lang: str) -> Translations:
         """Loads translation strings for a given language from a JSON file.
 
-        The expected file path is `public/locales/{lang}.json`.
+        The expected file path is `{locales_dir}/{lang}.json`. Successfully
+        loaded translations are cached per language, so repeated calls do not
+        re-read the file; the returned dictionary is shared between callers
+        and must not be modified. Use `clear_cache` to force a reload.
 
         Args:
             lang: The language code (e.g., "en", "es").
@@ -68,13 +93,16 @@ class DefaultTranslationProvider(TranslationProvider):
             a JSON decoding error, a warning is logged and an empty dictionary
             is returned, effectively falling back to default text or keys.
         """
-        # Path construction assumes execution from the project root.
-        # For more robustness, consider paths relative to this file or
-        # configurable base paths.
-        file_path = f"public/locales/{lang}.json"
+        cached = self._translations_cache.get(lang)
+        if cached is not None:
+            return cached
+
+        file_path = os.path.join(self.locales_dir, f"{lang}.json")
+        opener = self.opener if self.opener is not None else open
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with opener(file_path, "r", encoding="utf-8") as f:
                 translations: Translations = json.load(f)
+                self._translations_cache[lang] = translations
                 return translations
         except FileNotFoundError:
             logger.warning(
@@ -89,6 +117,10 @@ class DefaultTranslationProvider(TranslationProvider):
             )
             return {}
 
+    def clear_cache(self) -> None:
+        """Discards all cached translations so they are re-read on next use."""
+        self._translations_cache.clear()
+
     def translate_html_content(
         self, html_content: str, translations: Translations
     ) -> str:
@@ -109,6 +141,11 @@ class DefaultTranslationProvider(TranslationProvider):
         if not translations or not html_content.strip():
             return html_content
 
+        # Parsing with BeautifulSoup dominates the cost of this method, so skip
+        # it entirely for content that carries no translatable elements.
+        if "data-i18n" not in html_content:
+            return html_content
+
         soup = BeautifulSoup(html_content, "html.parser")
         for element in soup.find_all(attrs={"data-i18n": True}):
             if not isinstance(element, Tag):  # Should always be Tag due to find_all
@@ -139,7 +176,7 @@ class DefaultTranslationProvider(TranslationProvider):
 # Ideally, new code should instantiate and use DefaultTranslationProvider directly.
 
 # _default_provider is a module-level instance used by the convenience functions
-# below. It is intended to be stateless for these operations.
+# below. Its only state is the cache of loaded translation files.
 _default_provider = DefaultTranslationProvider()
 
 load_translations = _default_provider.load_translations
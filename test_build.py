@@ -4,24 +4,29 @@ Unit tests for the static site build script and its components.
 This module contains test cases for various parts of the build process,
 including translation loading, data loading, HTML generation for different
 content blocks, and the main build orchestration logic. It uses a temporary
-file system structure to simulate real project files (configs, data, locales,
-blocks) and extensive mocking to isolate units under test.
+file system structure, held in memory by pyfakefs, to simulate real project
+files (configs, data, locales, blocks) and extensive mocking to isolate units
+under test.
 """
 
+import contextlib
+import io
 import json
 import os
-import re
-import shutil
 import tempfile
 import unittest
-from typing import Any, Dict  # For type hinting self.dummy_config
+from pathlib import Path
+from typing import Any, Dict, List
 from unittest import mock
 
-from google.protobuf import json_format
+from google.protobuf.internal import api_implementation
 from google.protobuf.message import Message  # Explicit import for T = TypeVar bound
 from jinja2 import Environment, FileSystemLoader
+from pyfakefs import fake_filesystem_unittest
 
+from build import BuildOrchestrator
 from build import main as build_main
+from build_protocols import translation
 from build_protocols.data_loading import JsonProtoDataLoader
 from build_protocols.html_generation import (
     BlogHtmlGenerator,
@@ -32,6 +37,7 @@ from build_protocols.html_generation import (
     TestimonialsHtmlGenerator,
 )
 from build_protocols.interfaces import Translations
+from build_protocols.page_assembly import DefaultPageBuilder
 from build_protocols.translation import DefaultTranslationProvider
 
 # Generated protobuf messages
@@ -43,315 +49,330 @@ from generated.nav_item_pb2 import Navigation
 from generated.portfolio_item_pb2 import PortfolioItem
 from generated.testimonial_item_pb2 import TestimonialItem
 
-
-class TestBuildScript(unittest.TestCase):
-    """Test cases for build.py script components and main execution."""
-
-    def setUp(self) -> None:
-        """Set up a temporary test environment before each test.
-
-        This involves:
-        - Creating a temporary root directory.
-        - Changing the current working directory to this temporary root.
-        - Creating necessary subdirectories (public/locales, data, blocks, etc.).
-        - Instantiating service components (translation provider, data loader,
-          HTML generators) for direct testing.
-        - Creating dummy translation files, data files, config files, and
-          HTML block files within the temporary directory structure.
-        """
-        self.original_cwd: str = os.getcwd()
-        self.test_root_dir: str = tempfile.mkdtemp()
-        os.chdir(self.test_root_dir)
-
-        self._create_test_directories()
-        self._instantiate_services()
-        self._create_dummy_translation_files()
-        self._create_dummy_data_files()
-        self._create_dummy_config_and_index()
-        self._create_dummy_block_files()
-
-    def _create_test_directories(self) -> None:
-        """Creates the necessary directory structure within the temp root."""
-        self.test_locales_dir: str = os.path.join(
-            self.test_root_dir, "public", "locales"
-        )
-        self.test_data_dir: str = os.path.join(self.test_root_dir, "data")
-        # self.test_blocks_dir is no longer needed as dummy blocks go into templates/blocks
-        self.test_public_dir: str = os.path.join(self.test_root_dir, "public")
-        self.test_public_generated_configs_dir: str = os.path.join(
-            self.test_public_dir, "generated_configs"
-        )
-
-        os.makedirs(self.test_locales_dir, exist_ok=True)
-        os.makedirs(self.test_data_dir, exist_ok=True)
-        # os.makedirs(self.test_blocks_dir, exist_ok=True) # Not needed
-        os.makedirs(self.test_public_generated_configs_dir, exist_ok=True)
-        # Ensure the target directory for dummy block templates exists
-        os.makedirs(
-            os.path.join(self.test_root_dir, "templates", "blocks"), exist_ok=True
-        )
-
-    def _instantiate_services(self) -> None:
-        """Instantiates common service components used in tests."""
-        # Create a dummy Jinja2 environment for testing generators
-        # It needs a loader, even if templates aren't actually loaded in all unit tests.
-        # The "templates" directory is assumed to exist or be created by test setup if needed.
-        # For many generator unit tests, the actual rendering might be mocked,
-        # but the constructor needs the env.
-        # Ensure a dummy 'templates' dir exists for FileSystemLoader, or use a mock loader.
-        # For simplicity, assuming 'templates' might be a general dir or we mock rendering.
-        # Let's create a dummy templates dir for the loader to be valid.
-        # This directory is now created in _create_test_directories
-        # os.makedirs(
-        #     os.path.join(self.test_root_dir, "templates", "blocks"), exist_ok=True
-        # ) # Moved to _create_test_directories
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(os.path.join(self.test_root_dir, "templates"))
-        )
-
-        self.translation_provider = DefaultTranslationProvider()
-        self.data_loader = JsonProtoDataLoader[Message]()
-        self.portfolio_generator = PortfolioHtmlGenerator(jinja_env=self.jinja_env)
-        self.blog_generator = BlogHtmlGenerator(jinja_env=self.jinja_env)
-        self.features_generator = FeaturesHtmlGenerator(jinja_env=self.jinja_env)
-        self.testimonials_generator = TestimonialsHtmlGenerator(
-            jinja_env=self.jinja_env
-        )
-        self.hero_generator = HeroHtmlGenerator(jinja_env=self.jinja_env)
-        self.contact_form_generator = ContactFormHtmlGenerator(jinja_env=self.jinja_env)
-
-    def _create_dummy_translation_files(self) -> None:
-        """Creates dummy translation JSON files (en.json, es.json)."""
-        self.en_translations: Translations = {
-            "greeting": "Hello",
-            "farewell": "Goodbye",
-            "header_text": "Test Header",
-            "footer_text": "Test Footer",
-            "portfolio_alt_1": "Alt 1 EN",
-            "portfolio_title_1": "Title 1 EN",
-            "portfolio_desc_1": "Desc 1 EN",
-            "portfolio_alt_2": "Alt 2 EN",
-            "portfolio_title_2": "Title 2 EN",
-            "portfolio_desc_2": "Desc 2 EN",
-            "blog_title_1": "Blog Title 1 EN",
-            "blog_excerpt_1": "Excerpt 1 EN",
-            "blog_cta_1": "Read EN",
-            "blog_title_2": "Blog Title 2 EN",
-            "blog_excerpt_2": "Excerpt 2 EN",
-            "blog_cta_2": "More EN",
-            "feature_title_1": "Feat Title 1 EN",
-            "feature_desc_1": "Feat Desc 1 EN",
-            "feature_title_2": "Feat Title 2 EN",
-            "feature_desc_2": "Feat Desc 2 EN",
-            "testimonial_text_1": "Testimonial Text EN",
-            "testimonial_author_1": "Author EN",
-            "testimonial_alt_1": "Alt EN",
-            "hero_title_main_v1": "Hero V1 EN",
-            "hero_subtitle_main_v1": "Sub V1 EN",
-            "hero_cta_main_v1": "CTA V1 EN",
-            "hero_title_main_v2": "Hero V2 EN",
-            "hero_subtitle_main_v2": "Sub V2 EN",
-            "hero_cta_main_v2": "CTA V2 EN",
-            "contact_success": "Success EN",
-            "contact_error": "Error EN",
+# Fixture payloads shared by every test. They are serialized to JSON once, at
+# import time, and written verbatim into the fixture files; the dicts are
+# exposed on the test class for assertions.
+_EN_TRANSLATIONS: Translations = {
+    "greeting": "Hello",
+    "farewell": "Goodbye",
+    "header_text": "Test Header",
+    "footer_text": "Test Footer",
+    "portfolio_alt_1": "Alt 1 EN",
+    "portfolio_title_1": "Title 1 EN",
+    "portfolio_desc_1": "Desc 1 EN",
+    "portfolio_alt_2": "Alt 2 EN",
+    "portfolio_title_2": "Title 2 EN",
+    "portfolio_desc_2": "Desc 2 EN",
+    "blog_title_1": "Blog Title 1 EN",
+    "blog_excerpt_1": "Excerpt 1 EN",
+    "blog_cta_1": "Read EN",
+    "blog_title_2": "Blog Title 2 EN",
+    "blog_excerpt_2": "Excerpt 2 EN",
+    "blog_cta_2": "More EN",
+    "feature_title_1": "Feat Title 1 EN",
+    "feature_desc_1": "Feat Desc 1 EN",
+    "feature_title_2": "Feat Title 2 EN",
+    "feature_desc_2": "Feat Desc 2 EN",
+    "testimonial_text_1": "Testimonial Text EN",
+    "testimonial_author_1": "Author EN",
+    "testimonial_alt_1": "Alt EN",
+    "hero_title_main_v1": "Hero V1 EN",
+    "hero_subtitle_main_v1": "Sub V1 EN",
+    "hero_cta_main_v1": "CTA V1 EN",
+    "hero_title_main_v2": "Hero V2 EN",
+    "hero_subtitle_main_v2": "Sub V2 EN",
+    "hero_cta_main_v2": "CTA V2 EN",
+    "contact_success": "Success EN",
+    "contact_error": "Error EN",
+}
+_EN_JSON = json.dumps(_EN_TRANSLATIONS)
+
+_ES_TRANSLATIONS: Translations = {
+    "greeting": "Hola",
+    "farewell": "Adiós",
+    "header_text": "Cabecera de Prueba",
+    "footer_text": "Pie de Página de Prueba",
+    "portfolio_alt_1": "Alt 1 ES",
+    "portfolio_title_1": "Título 1 ES",
+    "portfolio_desc_1": "Desc 1 ES",
+    "portfolio_alt_2": "Alt 2 ES",
+    "portfolio_title_2": "Título 2 ES",
+    "portfolio_desc_2": "Desc 2 ES",
+    "blog_title_1": "Blog Título 1 ES",
+    "blog_excerpt_1": "Extracto 1 ES",
+    "blog_cta_1": "Leer ES",
+    "blog_title_2": "Blog Título 2 ES",
+    "blog_excerpt_2": "Extracto 2 ES",
+    "blog_cta_2": "Más ES",
+    "feature_title_1": "Caract Título 1 ES",
+    "feature_desc_1": "Caract Desc 1 ES",
+    "feature_title_2": "Caract Título 2 ES",
+    "feature_desc_2": "Caract Desc 2 ES",
+    "testimonial_text_1": "Testimonio Texto ES",
+    "testimonial_author_1": "Autor ES",
+    "testimonial_alt_1": "Alt ES",
+    "hero_title_main_v1": "Héroe V1 ES",
+    "hero_subtitle_main_v1": "Sub V1 ES",
+    "hero_cta_main_v1": "CTA V1 ES",
+    "hero_title_main_v2": "Héroe V2 ES",
+    "hero_subtitle_main_v2": "Sub V2 ES",
+    "hero_cta_main_v2": "CTA V2 ES",
+    "contact_success": "Éxito ES",
+    "contact_error": "Error ES",
+}
+_ES_JSON = json.dumps(_ES_TRANSLATIONS)
+
+_PORTFOLIO_ITEMS_DATA: List[Dict[str, Any]] = [
+    {
+        "id": "p1",
+        "image": {"src": "img1.jpg", "alt_text": {"key": "portfolio_alt_1"}},
+        "details": {
+            "title": {"key": "portfolio_title_1"},
+            "description": {"key": "portfolio_desc_1"},
+        },
+    },
+    {
+        "id": "p2",
+        "image": {"src": "img2.jpg", "alt_text": {"key": "portfolio_alt_2"}},
+        "details": {
+            "title": {"key": "portfolio_title_2"},
+            "description": {"key": "portfolio_desc_2"},
+        },
+    },
+]
+_PORTFOLIO_JSON = json.dumps(_PORTFOLIO_ITEMS_DATA)
+
+_BLOG_POSTS_DATA: List[Dict[str, Any]] = [
+    {
+        "id": "b1",
+        "title": {"key": "blog_title_1"},
+        "excerpt": {"key": "blog_excerpt_1"},
+        "cta": {"text": {"key": "blog_cta_1"}, "uri": "link1.html"},
+    },
+    {
+        "id": "b2",
+        "title": {"key": "blog_title_2"},
+        "excerpt": {"key": "blog_excerpt_2"},
+        "cta": {"text": {"key": "blog_cta_2"}, "uri": "link2.html"},
+    },
+]
+_BLOG_JSON = json.dumps(_BLOG_POSTS_DATA)
+
+_FEATURE_ITEMS_DATA: List[Dict[str, Any]] = [
+    {
+        "content": {
+            "title": {"key": "feature_title_1"},
+            "description": {"key": "feature_desc_1"},
         }
-        with open(
-            os.path.join(self.test_locales_dir, "en.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(self.en_translations, f)
-
-        self.es_translations: Translations = {
-            "greeting": "Hola",
-            "farewell": "Adiós",
-            "header_text": "Cabecera de Prueba",
-            "footer_text": "Pie de Página de Prueba",
-            "portfolio_alt_1": "Alt 1 ES",
-            "portfolio_title_1": "Título 1 ES",
-            "portfolio_desc_1": "Desc 1 ES",
-            "portfolio_alt_2": "Alt 2 ES",
-            "portfolio_title_2": "Título 2 ES",
-            "portfolio_desc_2": "Desc 2 ES",
-            "blog_title_1": "Blog Título 1 ES",
-            "blog_excerpt_1": "Extracto 1 ES",
-            "blog_cta_1": "Leer ES",
-            "blog_title_2": "Blog Título 2 ES",
-            "blog_excerpt_2": "Extracto 2 ES",
-            "blog_cta_2": "Más ES",
-            "feature_title_1": "Caract Título 1 ES",
-            "feature_desc_1": "Caract Desc 1 ES",
-            "feature_title_2": "Caract Título 2 ES",
-            "feature_desc_2": "Caract Desc 2 ES",
-            "testimonial_text_1": "Testimonio Texto ES",
-            "testimonial_author_1": "Autor ES",
-            "testimonial_alt_1": "Alt ES",
-            "hero_title_main_v1": "Héroe V1 ES",
-            "hero_subtitle_main_v1": "Sub V1 ES",
-            "hero_cta_main_v1": "CTA V1 ES",
-            "hero_title_main_v2": "Héroe V2 ES",
-            "hero_subtitle_main_v2": "Sub V2 ES",
-            "hero_cta_main_v2": "CTA V2 ES",
-            "contact_success": "Éxito ES",
-            "contact_error": "Error ES",
+    },
+    {
+        "content": {
+            "title": {"key": "feature_title_2"},
+            "description": {"key": "feature_desc_2"},
         }
-        with open(
-            os.path.join(self.test_locales_dir, "es.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(self.es_translations, f)
-
-    def _create_dummy_data_files(self) -> None:
-        """Creates dummy JSON data files for portfolio, blog, etc."""
-        self.portfolio_items_data = [
-            {
-                "id": "p1",
-                "image": {"src": "img1.jpg", "alt_text": {"key": "portfolio_alt_1"}},
-                "details": {
-                    "title": {"key": "portfolio_title_1"},
-                    "description": {"key": "portfolio_desc_1"},
-                },
-            },
-            {
-                "id": "p2",
-                "image": {"src": "img2.jpg", "alt_text": {"key": "portfolio_alt_2"}},
-                "details": {
-                    "title": {"key": "portfolio_title_2"},
-                    "description": {"key": "portfolio_desc_2"},
-                },
-            },
-        ]
-        with open(
-            os.path.join(self.test_data_dir, "portfolio.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(self.portfolio_items_data, f)
-
-        self.blog_posts_data = [
-            {
-                "id": "b1",
-                "title": {"key": "blog_title_1"},
-                "excerpt": {"key": "blog_excerpt_1"},
-                "cta": {"text": {"key": "blog_cta_1"}, "uri": "link1.html"},
-            },
-            {
-                "id": "b2",
-                "title": {"key": "blog_title_2"},
-                "excerpt": {"key": "blog_excerpt_2"},
-                "cta": {"text": {"key": "blog_cta_2"}, "uri": "link2.html"},
-            },
-        ]
-        with open(
-            os.path.join(self.test_data_dir, "blog.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(self.blog_posts_data, f)
+    },
+]
+_FEATURES_JSON = json.dumps(_FEATURE_ITEMS_DATA)
+
+_TESTIMONIAL_ITEMS_DATA: List[Dict[str, Any]] = [
+    {
+        "text": {"key": "testimonial_text_1"},
+        "author": {"key": "testimonial_author_1"},
+        "author_image": {
+            "src": "img_testimonial1.jpg",
+            "alt_text": {"key": "testimonial_alt_1"},
+        },
+    }
+]
+_TESTIMONIALS_JSON = json.dumps(_TESTIMONIAL_ITEMS_DATA)
+
+_HERO_ITEM_DATA: Dict[str, Any] = {
+    "variations": [
+        {
+            "variation_id": "var1",
+            "title": {"key": "hero_title_main_v1"},
+            "subtitle": {"key": "hero_subtitle_main_v1"},
+            "cta": {"text": {"key": "hero_cta_main_v1"}, "uri": "#gohere_v1"},
+        },
+        {
+            "variation_id": "var2",
+            "title": {"key": "hero_title_main_v2"},
+            "subtitle": {"key": "hero_subtitle_main_v2"},
+            "cta": {"text": {"key": "hero_cta_main_v2"}, "uri": "#gohere_v2"},
+        },
+    ],
+    "default_variation_id": "var1",
+}
+_HERO_JSON = json.dumps(_HERO_ITEM_DATA)
+
+_CONFIG: Dict[str, Any] = {
+    "blocks": [
+        "hero.html",
+        "features.html",
+        "testimonials.html",
+        "portfolio.html",
+        "blog.html",
+    ],
+    "supported_langs": ["en", "es"],
+    "default_lang": "en",
+    # Ensure this path is used by tests
+    "navigation_data_file": os.path.join("data", "navigation.json"),
+    "base_html_file": "index.html",
+}
+_CONFIG_JSON = json.dumps(_CONFIG)
+
+_NAVIGATION_JSON = json.dumps(
+    {"items": [{"label": {"key": "nav_home"}, "href": "index.html"}]}
+)
 
-        self.feature_items_data = [
-            {
-                "content": {
-                    "title": {"key": "feature_title_1"},
-                    "description": {"key": "feature_desc_1"},
-                }
-            },
-            {
-                "content": {
-                    "title": {"key": "feature_title_2"},
-                    "description": {"key": "feature_desc_2"},
-                }
-            },
-        ]
-        with open(
-            os.path.join(self.test_data_dir, "features.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(self.feature_items_data, f)
+# Sample messages for the generate tests. Protobuf construction is not free, so
+# they are built once; tests treat them as read-only.
+_FEATURE_ITEM = FeatureItem(content={"title": {"key": "feature_title_1"}})
+_HERO_ITEM = HeroItem(
+    default_variation_id="var1",
+    variations=[
+        HeroItemContent(
+            variation_id="var1",
+            title={"key": "hero_title_main_v1"},
+            subtitle={"key": "hero_subtitle_main_v1"},
+            cta={"text": {"key": "hero_cta_main_v1"}, "uri": "#gohere_v1"},
+        ),
+        HeroItemContent(
+            variation_id="var2",
+            title={"key": "hero_title_main_v2"},
+            subtitle={"key": "hero_subtitle_main_v2"},
+            cta={"text": {"key": "hero_cta_main_v2"}, "uri": "#gohere_v2"},
+        ),
+    ],
+)
+_HERO_ITEM_WITHOUT_DEFAULT = HeroItem(
+    variations=[
+        HeroItemContent(variation_id="var1", title={"key": "hero_title_main_v1"}),
+        HeroItemContent(variation_id="var2", title={"key": "hero_title_main_v2"}),
+    ],
+)
 
-        self.testimonial_items_data = [
-            {
-                "text": {"key": "testimonial_text_1"},
-                "author": {"key": "testimonial_author_1"},
-                "author_image": {
-                    "src": "img_testimonial1.jpg",
-                    "alt_text": {"key": "testimonial_alt_1"},
-                },
-            }
-        ]
-        with open(
-            os.path.join(self.test_data_dir, "testimonials.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(self.testimonial_items_data, f)
-
-        self.hero_item_data = {
-            "variations": [
-                {
-                    "variation_id": "var1",
-                    "title": {"key": "hero_title_main_v1"},
-                    "subtitle": {"key": "hero_subtitle_main_v1"},
-                    "cta": {"text": {"key": "hero_cta_main_v1"}, "uri": "#gohere_v1"},
-                },
-                {
-                    "variation_id": "var2",
-                    "title": {"key": "hero_title_main_v2"},
-                    "subtitle": {"key": "hero_subtitle_main_v2"},
-                    "cta": {"text": {"key": "hero_cta_main_v2"}, "uri": "#gohere_v2"},
-                },
-            ],
-            "default_variation_id": "var1",
-        }
-        with open(
-            os.path.join(self.test_data_dir, "hero.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(self.hero_item_data, f)
-
-    def _create_dummy_config_and_index(self) -> None:
-        """Creates dummy index.html and config.json files."""
-        self.dummy_index_content = """
-        <!DOCTYPE html>
-        <html>
-        <head><title>Test</title></head>
-        <body>
-            <header data-i18n="header_text">Header</header>
-            <main>
-                <p>Placeholder</p>
-            </main>
-            <footer data-i18n="footer_text">Footer</footer>
-        </body>
-        </html>
-        """
-        with open("index.html", "w", encoding="utf-8") as f:
-            f.write(self.dummy_index_content)
-
-        self.dummy_config: Dict[str, Any] = {
-            "blocks": [
-                "hero.html",
-                "features.html",
-                "testimonials.html",
-                "portfolio.html",
-                "blog.html",
-            ],
-            "supported_langs": ["en", "es"],
-            "default_lang": "en",
-            "navigation_data_file": os.path.join(
-                "data", "navigation.json"
-            ),  # Ensure this path is used by tests
-            "base_html_file": "index.html",
-        }
-        os.makedirs("public", exist_ok=True)
-        with open(os.path.join("public", "config.json"), "w", encoding="utf-8") as f:
-            json.dump(self.dummy_config, f)
-        # Create dummy navigation.json
-        dummy_nav_data = {
-            "items": [{"label": {"key": "nav_home"}, "href": "index.html"}]
-        }
-        with open(
-            os.path.join(self.test_data_dir, "navigation.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(dummy_nav_data, f)
+# Data returned by the mocked loaders and cache in the main() test, keyed by a
+# substring of the data file path or cache key. Built once at import time so
+# the lookup does not depend on the order in which languages are processed.
+_MAIN_LIST_ITEMS: Dict[str, List[Message]] = {
+    "portfolio": [PortfolioItem(id="p1", details={"title": {"key": "ptk"}})],
+    "blog": [BlogPost(id="b1", title={"key": "btk"})],
+    "features": [FeatureItem(content={"title": {"key": "ftk"}})],
+    "testimonials": [TestimonialItem(text={"key": "ttk"})],
+}
+_MAIN_SINGLE_ITEMS: Dict[str, Message] = {
+    "hero": HeroItem(
+        default_variation_id="v1",
+        variations=[HeroItemContent(variation_id="v1", title={"key": "htk"})],
+    ),
+    "contact_form": ContactFormConfig(
+        form_action_uri="/test_action",
+        success_message_key="contact_success",
+        error_message_key="contact_error",
+    ),
+    "navigation": Navigation(),
+}
+
+
+# (generator attribute, items, translations, expected HTML fragments) for the
+# list-based HTML generators, shared by the generate tests below.
+_LIST_GENERATOR_CASES = (
+    (
+        "portfolio_generator",
+        [
+            PortfolioItem(
+                id="p1",
+                image={"src": "img.png", "alt_text": {"key": "p_alt"}},
+                details={"title": {"key": "p_title"}, "description": {"key": "p_desc"}},
+            )
+        ],
+        {
+            "p_title": "Translated Title",
+            "p_desc": "Translated Description",
+            "p_alt": "Translated Alt Text",
+        },
+        (
+            "Translated Title",
+            "Translated Description",
+            'src="img.png"',
+            'alt="Translated Alt Text"',
+            'id="p1"',
+        ),
+    ),
+    (
+        "blog_generator",
+        [
+            BlogPost(
+                id="b1",
+                title={"key": "b_title"},
+                excerpt={"key": "b_excerpt"},
+                cta={"text": {"key": "b_cta"}, "uri": "link.html"},
+            )
+        ],
+        {
+            "b_title": "Blog Title",
+            "b_excerpt": "Blog Excerpt",
+            "b_cta": "Read More",
+        },
+        (
+            "Blog Title",
+            "Blog Excerpt",
+            'href="link.html"',
+            ">Read More</a>",
+            'id="b1"',
+        ),
+    ),
+    (
+        "features_generator",
+        [
+            FeatureItem(
+                content={"title": {"key": "f_title"}, "description": {"key": "f_desc"}}
+            )
+        ],
+        {
+            "f_title": "Translated Feature Title",
+            "f_desc": "Translated Feature Description",
+        },
+        (
+            "Translated Feature Title",
+            "Translated Feature Description",
+            '<div class="feature-item">',
+        ),
+    ),
+    (
+        "testimonials_generator",
+        [
+            TestimonialItem(
+                text={"key": "t_text"},
+                author={"key": "t_author"},
+                author_image={"src": "testimonial.png", "alt_text": {"key": "t_alt"}},
+            )
+        ],
+        {
+            "t_text": "Translated Testimonial Text",
+            "t_author": "Translated Testimonial Author",
+            "t_alt": "Translated Testimonial Alt Text",
+        },
+        (
+            "Translated Testimonial Text",
+            "Translated Testimonial Author",
+            'src="testimonial.png"',
+            'alt="Translated Testimonial Alt Text"',
+            '<div class="testimonial-item">',
+            '<p>"Translated Testimonial Text"</p>',
+        ),
+    ),
+)
 
-    def _create_dummy_block_files(self) -> None:
-        """Creates dummy HTML block files in templates/blocks/ directory."""
-        # The directory templates/blocks is created in _create_test_directories
-        dummy_blocks_dir = os.path.join(
-            "templates", "blocks"
-        )  # Relative to self.test_root_dir
 
-        # For hero.html, matching the context from HeroHtmlGenerator and test assertions
-        hero_template_content = """
+# Block templates written to templates/blocks. Each renders the context its
+# generator passes (`items`, `hero_item` or `config`) so the generate tests can
+# assert on the translated output.
+_BLOCKS = (
+    (
+        "hero.html",
+        """
 <section class="hero">
     {% if hero_item %}
     <h1>{{ translations[hero_item.title.key] }}</h1>
@@ -362,21 +383,11 @@ class TestBuildScript(unittest.TestCase):
     <!-- Hero item data was None or empty in dummy template -->
     {% endif %}
 </section>
-"""
-        with open(
-            os.path.join(dummy_blocks_dir, "hero.html"), "w", encoding="utf-8"
-        ) as f:
-            f.write(hero_template_content)
-
-        # For list-based items, the generators pass `items` to the template.
-        # The dummy templates should loop through `items` and display relevant translated fields.
-        # Example for features.html (others will be similar)
-        # test_generate_features_html asserts:
-        # self.assertIn("Translated Feature Title", html)
-        # self.assertIn("Translated Feature Description", html)
-        # self.assertIn('<div class="feature-item">', html)
-        # FeatureItem has content.title.key and content.description.key
-        features_template_content = """
+""",
+    ),
+    (
+        "features.html",
+        """
 <div>
     {% for item in items %}
     <div class="feature-item">
@@ -385,20 +396,11 @@ class TestBuildScript(unittest.TestCase):
     </div>
     {% endfor %}
 </div>
-"""
-        with open(
-            os.path.join(dummy_blocks_dir, "features.html"), "w", encoding="utf-8"
-        ) as f:
-            f.write(features_template_content)
-
-        # test_generate_testimonials_html asserts:
-        # self.assertIn("Translated Testimonial Text", html)
-        # self.assertIn("Translated Testimonial Author", html)
-        # self.assertIn('src="testimonial.png"', html)
-        # self.assertIn('alt="Translated Testimonial Alt Text"', html)
-        # self.assertIn('<div class="testimonial-item">', html)
-        # TestimonialItem has text.key, author.key, author_image.src, author_image.alt_text.key
-        testimonials_template_content = """
+""",
+    ),
+    (
+        "testimonials.html",
+        """
 <div>
     {% for item in items %}
     <div class="testimonial-item">
@@ -408,20 +410,11 @@ class TestBuildScript(unittest.TestCase):
     </div>
     {% endfor %}
 </div>
-"""
-        with open(
-            os.path.join(dummy_blocks_dir, "testimonials.html"), "w", encoding="utf-8"
-        ) as f:
-            f.write(testimonials_template_content)
-
-        # test_generate_portfolio_html asserts:
-        # self.assertIn("Translated Title", html)
-        # self.assertIn("Translated Description", html)
-        # self.assertIn('src="img.png"', html)
-        # self.assertIn('alt="Translated Alt Text"', html)
-        # self.assertIn('id="p1"', html)
-        # PortfolioItem has id, image.src, image.alt_text.key, details.title.key, details.description.key
-        portfolio_template_content = """
+""",
+    ),
+    (
+        "portfolio.html",
+        """
 <div>
     {% for item in items %}
     <div id="{{ item.id }}">
@@ -431,20 +424,11 @@ class TestBuildScript(unittest.TestCase):
     </div>
     {% endfor %}
 </div>
-"""
-        with open(
-            os.path.join(dummy_blocks_dir, "portfolio.html"), "w", encoding="utf-8"
-        ) as f:
-            f.write(portfolio_template_content)
-
-        # test_generate_blog_html asserts:
-        # self.assertIn("Blog Title", html)
-        # self.assertIn("Blog Excerpt", html)
-        # self.assertIn('href="link.html"', html)
-        # self.assertIn(">Read More</a>", html)
-        # self.assertIn('id="b1"', html)
-        # BlogPost has id, title.key, excerpt.key, cta.uri, cta.text.key
-        blog_template_content = """
+""",
+    ),
+    (
+        "blog.html",
+        """
 <div>
     {% for item in items %}
     <article id="{{ item.id }}">
@@ -454,33 +438,205 @@ class TestBuildScript(unittest.TestCase):
     </article>
     {% endfor %}
 </div>
-"""
-        with open(
-            os.path.join(dummy_blocks_dir, "blog.html"), "w", encoding="utf-8"
-        ) as f:
-            f.write(blog_template_content)
-
-        # ContactFormHtmlGenerator passes `config` to template.
-        # The tests for this generator are not among the initial failures, but good to be consistent.
-        # ContactFormConfig has form_action_uri, success_message_key, error_message_key
-        contact_form_template_content = """
+""",
+    ),
+    (
+        "contact-form.html",
+        """
 <form id="contact-form" action="{{ config.form_action_uri if config else '' }}">
     {% if config %}
     <p class="success-message">{{ translations[config.success_message_key] }}</p>
     <p class="error-message">{{ translations[config.error_message_key] }}</p>
     {% endif %}
 </form>
-"""
-        with open(
-            os.path.join(dummy_blocks_dir, "contact-form.html"), "w", encoding="utf-8"
-        ) as f:
-            f.write(contact_form_template_content)
+""",
+    ),
+)
+
+
+class TestBuildScript(fake_filesystem_unittest.TestCase):
+    """Test cases for build.py script components and main execution."""
+
+    en_translations = _EN_TRANSLATIONS
+    es_translations = _ES_TRANSLATIONS
+    portfolio_items_data = _PORTFOLIO_ITEMS_DATA
+    blog_posts_data = _BLOG_POSTS_DATA
+    feature_items_data = _FEATURE_ITEMS_DATA
+    testimonial_items_data = _TESTIMONIAL_ITEMS_DATA
+    hero_item_data = _HERO_ITEM_DATA
+    dummy_config = _CONFIG
+
+    # Set once in setUpClass and shared by every test.
+    test_root_dir: str
+    test_locales_dir: str
+    test_data_dir: str
+    test_public_dir: str
+    test_public_generated_configs_dir: str
+    file_registry: Dict[str, str]
+    en_json_path: str
+    es_json_path: str
+    portfolio_json_path: str
+    blog_json_path: str
+    features_json_path: str
+    testimonials_json_path: str
+    hero_json_path: str
+    navigation_json_path: str
+    jinja_env: Environment
+    data_loader: JsonProtoDataLoader[Message]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up a shared temporary test environment once for the class.
+
+        The fixture files are identical for every test, so they are written a
+        single time, into an in-memory fake filesystem (pyfakefs) rather than
+        onto disk. This involves:
+        - Creating a temporary root directory. Tests never change the working
+          directory; the build is pointed at this root explicitly instead.
+        - Creating necessary subdirectories (public/locales, data, blocks, etc.).
+        - Creating dummy translation files, data files, config files, and
+          HTML block files within the temporary directory structure.
+
+        Tests that need extra files create them themselves and remove them
+        with `addCleanup`, so the shared fixtures stay unchanged.
+
+        Fails immediately if protobuf is running on its pure-Python backend
+        (see conftest.py), rather than letting the suite run slowly.
+        """
+        if api_implementation.Type() not in ("cpp", "upb"):
+            raise AssertionError(
+                "Tests expect a native protobuf backend, got "
+                f"'{api_implementation.Type()}'. Unset "
+                "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION or set it to 'upb'."
+            )
+
+        # All file system access in this class goes to the fake filesystem,
+        # which is discarded automatically after the last test.
+        cls.setUpClassPyfakefs()
+        cls.test_root_dir = tempfile.mkdtemp()
+
+        cls._create_test_directories()
+        cls._create_dummy_json_files()
+        cls._create_dummy_config()
+        cls._create_dummy_block_files()
+        cls._create_file_registry()
+
+        # The environment only caches compiled templates for the unchanging
+        # fixtures, and the data loader holds no state, so both are shared.
+        cls.jinja_env = Environment(
+            loader=FileSystemLoader(os.path.join(cls.test_root_dir, "templates"))
+        )
+        cls.data_loader = JsonProtoDataLoader[Message]()
+
+    def setUp(self) -> None:
+        """Instantiate fresh service components before each test.
+
+        The translation provider and HTML generators cache what they load, so
+        each test gets its own instances to keep those caches isolated.
+        """
+        self._instantiate_services()
+
+    @classmethod
+    def _create_test_directories(cls) -> None:
+        """Creates the necessary directory structure within the temp root."""
+        cls.test_locales_dir = os.path.join(cls.test_root_dir, "public", "locales")
+        cls.test_data_dir = os.path.join(cls.test_root_dir, "data")
+        # cls.test_blocks_dir is no longer needed as dummy blocks go into templates/blocks
+        cls.test_public_dir = os.path.join(cls.test_root_dir, "public")
+        cls.test_public_generated_configs_dir = os.path.join(
+            cls.test_public_dir, "generated_configs"
+        )
 
-    def tearDown(self) -> None:
-        """Clean up the temporary test environment after each test."""
-        os.chdir(self.original_cwd)
-        if hasattr(self, "test_root_dir") and os.path.exists(self.test_root_dir):
-            shutil.rmtree(self.test_root_dir)
+        os.makedirs(cls.test_locales_dir, exist_ok=True)
+        os.makedirs(cls.test_data_dir, exist_ok=True)
+        # os.makedirs(cls.test_blocks_dir, exist_ok=True) # Not needed
+        os.makedirs(cls.test_public_generated_configs_dir, exist_ok=True)
+        # Ensure the target directory for dummy block templates exists
+        os.makedirs(
+            os.path.join(cls.test_root_dir, "templates", "blocks"), exist_ok=True
+        )
+
+        # Fixture file paths, joined once and shared by the writers and tests.
+        cls.en_json_path = os.path.join(cls.test_locales_dir, "en.json")
+        cls.es_json_path = os.path.join(cls.test_locales_dir, "es.json")
+        cls.portfolio_json_path = os.path.join(cls.test_data_dir, "portfolio.json")
+        cls.blog_json_path = os.path.join(cls.test_data_dir, "blog.json")
+        cls.features_json_path = os.path.join(cls.test_data_dir, "features.json")
+        cls.testimonials_json_path = os.path.join(
+            cls.test_data_dir, "testimonials.json"
+        )
+        cls.hero_json_path = os.path.join(cls.test_data_dir, "hero.json")
+        cls.navigation_json_path = os.path.join(cls.test_data_dir, "navigation.json")
+
+    @classmethod
+    def _create_dummy_json_files(cls) -> None:
+        """Writes the pre-serialized translation and data JSON fixtures."""
+        fixtures = {
+            cls.en_json_path: _EN_JSON,
+            cls.es_json_path: _ES_JSON,
+            cls.portfolio_json_path: _PORTFOLIO_JSON,
+            cls.blog_json_path: _BLOG_JSON,
+            cls.features_json_path: _FEATURES_JSON,
+            cls.testimonials_json_path: _TESTIMONIALS_JSON,
+            cls.hero_json_path: _HERO_JSON,
+            cls.navigation_json_path: _NAVIGATION_JSON,
+        }
+        for path, payload in fixtures.items():
+            Path(path).write_text(payload, encoding="utf-8")
+
+    @classmethod
+    def _create_dummy_config(cls) -> None:
+        """Creates the config.json file."""
+        Path(cls.test_public_dir, "config.json").write_text(
+            _CONFIG_JSON, encoding="utf-8"
+        )
+
+    @classmethod
+    def _create_dummy_block_files(cls) -> None:
+        """Creates dummy HTML block files in templates/blocks/ directory."""
+        # The directory templates/blocks is created in _create_test_directories
+        dummy_blocks_dir = Path(cls.test_root_dir, "templates", "blocks")
+        for name, content in _BLOCKS:
+            (dummy_blocks_dir / name).write_text(content, encoding="utf-8")
+
+    @classmethod
+    def _create_file_registry(cls) -> None:
+        """Maps the block templates the mocked main() test reads to their contents.
+
+        Config, translations and navigation come from patched loaders, so the
+        build only opens the block templates listed in the config. Built once,
+        so a test that patches `builtins.open` can answer each read with a
+        fresh `io.StringIO` instead of constructing `mock.mock_open` objects
+        per call.
+        """
+        block_placeholders = {
+            "hero.html": "{{hero_content}}",
+            "features.html": "{{feature_items}}",
+            "testimonials.html": "{{testimonial_items}}",
+            "portfolio.html": "{{portfolio_items}}",
+            "blog.html": "{{blog_posts}}",
+        }
+        cls.file_registry = {
+            os.path.join("templates", "blocks", block_name): f"<div>{placeholder}</div>"
+            for block_name, placeholder in block_placeholders.items()
+        }
+
+    def _instantiate_services(self) -> None:
+        """Instantiates the stateful service components used in tests.
+
+        The Jinja environment and data loader are shared from `setUpClass`.
+        """
+        self.translation_provider = DefaultTranslationProvider(
+            locales_dir=self.test_locales_dir
+        )
+        self.portfolio_generator = PortfolioHtmlGenerator(jinja_env=self.jinja_env)
+        self.blog_generator = BlogHtmlGenerator(jinja_env=self.jinja_env)
+        self.features_generator = FeaturesHtmlGenerator(jinja_env=self.jinja_env)
+        self.testimonials_generator = TestimonialsHtmlGenerator(
+            jinja_env=self.jinja_env
+        )
+        self.hero_generator = HeroHtmlGenerator(jinja_env=self.jinja_env)
+        self.contact_form_generator = ContactFormHtmlGenerator(jinja_env=self.jinja_env)
 
     def test_load_translations_existing(self):
         """Test loading existing translation files using DefaultTranslationProvider."""
@@ -490,6 +646,26 @@ class TestBuildScript(unittest.TestCase):
         translations_es = self.translation_provider.load_translations("es")
         self.assertEqual(translations_es["greeting"], self.es_translations["greeting"])
 
+    def test_load_translations_cached(self):
+        """Test that translations are read from disk once per language."""
+        with mock.patch("builtins.open", wraps=open) as mock_file_open:
+            first = self.translation_provider.load_translations("en")
+            second = self.translation_provider.load_translations("en")
+            self.assertIs(first, second)
+            self.assertEqual(mock_file_open.call_count, 1)
+
+            self.translation_provider.clear_cache()
+            reloaded = self.translation_provider.load_translations("en")
+            self.assertEqual(mock_file_open.call_count, 2)
+        self.assertEqual(reloaded, self.en_translations)
+
+    def test_load_translations_with_injected_opener(self):
+        """Test that translations are read through the injected opener."""
+        provider = DefaultTranslationProvider(
+            locales_dir="unused", opener=lambda *args, **kwargs: io.StringIO(_ES_JSON)
+        )
+        self.assertEqual(provider.load_translations("es"), self.es_translations)
+
     def test_load_translations_non_existing(self):
         """Test loading non-existing translation file with DefaultTranslationProvider."""
         translations = self.translation_provider.load_translations("non_existent_lang")
@@ -497,12 +673,16 @@ class TestBuildScript(unittest.TestCase):
 
     def test_load_translations_invalid_json(self):
         """Test loading translation file with invalid JSON with DefaultTranslationProvider."""
-        invalid_json_file_path = os.path.join(self.test_locales_dir, "invalid.json")
-        with open(invalid_json_file_path, "w", encoding="utf-8") as f:
-            f.write('{"greeting": "Hello", "farewell":')  # Malformed JSON
-
-        translations = self.translation_provider.load_translations("invalid")
-        self.assertEqual(translations, {})
+        opener = mock.Mock(
+            return_value=io.StringIO('{"greeting": "Hello", "farewell":')
+        )
+        provider = DefaultTranslationProvider(
+            locales_dir=self.test_locales_dir, opener=opener
+        )
+        self.assertEqual(provider.load_translations("invalid"), {})
+        opener.assert_called_once_with(
+            os.path.join(self.test_locales_dir, "invalid.json"), "r", encoding="utf-8"
+        )
 
     def test_translate_html_content(self):
         """Test HTML content translation with DefaultTranslationProvider."""
@@ -518,6 +698,26 @@ class TestBuildScript(unittest.TestCase):
         self.assertIn(test_translations["greeting"], translated_html)
         self.assertIn(test_translations["farewell"], translated_html)
 
+    def test_translate_html_content_many_keys(self):
+        """Test that a large key set is applied in a single parse of the HTML."""
+        translations = {f"key_{i}": f"Translated {i}" for i in range(500)}
+        html_content = "".join(
+            f'<span data-i18n="key_{i}">Original {i}</span>' for i in range(500)
+        )
+        with mock.patch(
+            "build_protocols.translation.BeautifulSoup",
+            wraps=translation.BeautifulSoup,
+        ) as mock_soup:
+            translated_html = self.translation_provider.translate_html_content(
+                html_content, translations
+            )
+        mock_soup.assert_called_once()
+        self.assertNotIn("Original", translated_html)
+        for i in (0, 249, 499):
+            self.assertIn(
+                f'<span data-i18n="key_{i}">Translated {i}</span>', translated_html
+            )
+
     def test_translate_html_content_no_translations(self):
         """Test HTML content translation with no translations with DefaultTranslationProvider."""
         html_content = '<p data-i18n="greeting">Greeting</p>'
@@ -538,11 +738,20 @@ class TestBuildScript(unittest.TestCase):
         self.assertIn(test_translations["greeting"], translated_html)
         self.assertIn("Missing", translated_html)  # Should remain if key is missing
 
+    def test_translate_html_content_without_i18n_attributes(self):
+        """Test that content without data-i18n attributes is returned untouched."""
+        html_content = "<div><p>Static</p><br></div>"
+        with mock.patch("build_protocols.translation.BeautifulSoup") as mock_soup:
+            translated_html = self.translation_provider.translate_html_content(
+                html_content, self.en_translations
+            )
+        self.assertEqual(translated_html, html_content)
+        mock_soup.assert_not_called()
+
     def test_load_dynamic_data_portfolio(self):
         """Test loading dynamic portfolio data with JsonProtoDataLoader."""
-        portfolio_file_path = os.path.join("data", "portfolio.json")
         items = self.data_loader.load_dynamic_list_data(
-            portfolio_file_path, PortfolioItem
+            self.portfolio_json_path, PortfolioItem
         )
         self.assertEqual(len(items), len(self.portfolio_items_data))
         if items:
@@ -554,8 +763,9 @@ class TestBuildScript(unittest.TestCase):
 
     def test_load_dynamic_data_feature(self):
         """Test loading dynamic feature data with JsonProtoDataLoader."""
-        feature_file_path = os.path.join("data", "features.json")
-        items = self.data_loader.load_dynamic_list_data(feature_file_path, FeatureItem)
+        items = self.data_loader.load_dynamic_list_data(
+            self.features_json_path, FeatureItem
+        )
         self.assertEqual(len(items), len(self.feature_items_data))
         if items:
             self.assertIsInstance(items[0], FeatureItem)
@@ -566,9 +776,8 @@ class TestBuildScript(unittest.TestCase):
 
     def test_load_dynamic_data_testimonial(self):
         """Test loading dynamic testimonial data with JsonProtoDataLoader."""
-        testimonial_file_path = os.path.join("data", "testimonials.json")
         items = self.data_loader.load_dynamic_list_data(
-            testimonial_file_path, TestimonialItem
+            self.testimonials_json_path, TestimonialItem
         )
         self.assertEqual(len(items), len(self.testimonial_items_data))
         if items:
@@ -579,8 +788,9 @@ class TestBuildScript(unittest.TestCase):
 
     def test_load_single_item_dynamic_data_hero(self):
         """Test loading dynamic hero item data with JsonProtoDataLoader."""
-        hero_file_path = os.path.join("data", "hero.json")
-        item = self.data_loader.load_dynamic_single_item_data(hero_file_path, HeroItem)
+        item = self.data_loader.load_dynamic_single_item_data(
+            self.hero_json_path, HeroItem
+        )
         self.assertIsNotNone(item)
         if item and item.variations:  # type: ignore
             self.assertIsInstance(item, HeroItem)
@@ -592,14 +802,13 @@ class TestBuildScript(unittest.TestCase):
     def test_load_single_item_dynamic_data_not_found(self):
         """Test loading single item from non-existent file with JsonProtoDataLoader."""
         item = self.data_loader.load_dynamic_single_item_data(
-            os.path.join("data", "non_existent_hero.json"), HeroItem
+            os.path.join(self.test_data_dir, "non_existent_hero.json"), HeroItem
         )
         self.assertIsNone(item)
 
     def test_load_dynamic_data_blog(self):
         """Test loading dynamic blog data with JsonProtoDataLoader."""
-        blog_file_path = os.path.join("data", "blog.json")
-        posts = self.data_loader.load_dynamic_list_data(blog_file_path, BlogPost)
+        posts = self.data_loader.load_dynamic_list_data(self.blog_json_path, BlogPost)
         self.assertEqual(len(posts), len(self.blog_posts_data))
         if posts:
             self.assertIsInstance(posts[0], BlogPost)
@@ -610,7 +819,7 @@ class TestBuildScript(unittest.TestCase):
     def test_load_dynamic_data_file_not_found(self):
         """Test loading dynamic data from a non-existent file with JsonProtoDataLoader."""
         items = self.data_loader.load_dynamic_list_data(
-            os.path.join("data", "non_existent_data.json"), PortfolioItem
+            os.path.join(self.test_data_dir, "non_existent_data.json"), PortfolioItem
         )
         self.assertEqual(items, [])
 
@@ -618,125 +827,52 @@ class TestBuildScript(unittest.TestCase):
         """Test loading dynamic data from a file with invalid JSON with JsonProtoDataLoader."""
         invalid_json_filename = "invalid_data.json"
         invalid_json_path_abs = os.path.join(self.test_data_dir, invalid_json_filename)
+        self.addCleanup(os.remove, invalid_json_path_abs)
         with open(invalid_json_path_abs, "w", encoding="utf-8") as f:
             f.write("[{'title': 'Test' }, {]")  # Invalid JSON
 
         items = self.data_loader.load_dynamic_list_data(
-            os.path.join("data", invalid_json_filename), PortfolioItem
+            invalid_json_path_abs, PortfolioItem
         )
         self.assertEqual(items, [])
 
-    def test_generate_portfolio_html(self):
-        """Test generation of portfolio HTML with PortfolioHtmlGenerator."""
-        items = [
-            PortfolioItem(
-                id="p1",
-                image={"src": "img.png", "alt_text": {"key": "p_alt"}},
-                details={"title": {"key": "p_title"}, "description": {"key": "p_desc"}},
-            )
-        ]
-        translations = {
-            "p_title": "Translated Title",
-            "p_desc": "Translated Description",
-            "p_alt": "Translated Alt Text",
-        }
-        html = self.portfolio_generator.generate_html(items, translations)
-        self.assertIn("Translated Title", html)
-        self.assertIn("Translated Description", html)
-        self.assertIn('src="img.png"', html)
-        self.assertIn('alt="Translated Alt Text"', html)
-        self.assertIn('id="p1"', html)
-
-    def test_generate_portfolio_html_empty(self):
-        """Test portfolio HTML generation with no items."""
-        html = self.portfolio_generator.generate_html([], self.en_translations)
-        self.assertEqual(html.strip(), "")
-
-    def test_generate_blog_html(self):
-        """Test generation of blog HTML with BlogHtmlGenerator."""
-        posts = [
-            BlogPost(
-                id="b1",
-                title={"key": "b_title"},
-                excerpt={"key": "b_excerpt"},
-                cta={"text": {"key": "b_cta"}, "uri": "link.html"},
-            )
-        ]
-        translations = {
-            "b_title": "Blog Title",
-            "b_excerpt": "Blog Excerpt",
-            "b_cta": "Read More",
-        }
-        html = self.blog_generator.generate_html(posts, translations)
-        self.assertIn("Blog Title", html)
-        self.assertIn("Blog Excerpt", html)
-        self.assertIn('href="link.html"', html)
-        self.assertIn(">Read More</a>", html)
-        self.assertIn('id="b1"', html)
-
-    def test_generate_blog_html_empty(self):
-        """Test blog HTML generation with no posts."""
-        html = self.blog_generator.generate_html([], self.en_translations)
-        self.assertEqual(html.strip(), "")
-
-    def test_generate_features_html(self):
-        """Test generation of features HTML with FeaturesHtmlGenerator."""
-        items = [
-            FeatureItem(
-                content={"title": {"key": "f_title"}, "description": {"key": "f_desc"}}
-            )
-        ]
-        translations = {
-            "f_title": "Translated Feature Title",
-            "f_desc": "Translated Feature Description",
-        }
-        html = self.features_generator.generate_html(items, translations)
-        self.assertIn("Translated Feature Title", html)
-        self.assertIn("Translated Feature Description", html)
-        self.assertIn('<div class="feature-item">', html)
-
-    def test_generate_features_html_empty(self):
-        """Test features HTML generation with no items."""
-        html = self.features_generator.generate_html([], self.en_translations)
-        self.assertEqual(html.strip(), "")
-
-    def test_generate_testimonials_html(self):
-        """Test generation of testimonials HTML with TestimonialsHtmlGenerator."""
-        items = [
-            TestimonialItem(
-                text={"key": "t_text"},
-                author={"key": "t_author"},
-                author_image={"src": "testimonial.png", "alt_text": {"key": "t_alt"}},
-            )
-        ]
-        translations = {
-            "t_text": "Translated Testimonial Text",
-            "t_author": "Translated Testimonial Author",
-            "t_alt": "Translated Testimonial Alt Text",
-        }
-        html = self.testimonials_generator.generate_html(items, translations)
-        self.assertIn("Translated Testimonial Text", html)
-        self.assertIn("Translated Testimonial Author", html)
-        self.assertIn('src="testimonial.png"', html)
-        self.assertIn('alt="Translated Testimonial Alt Text"', html)
-        self.assertIn('<div class="testimonial-item">', html)
-        self.assertIn(f'<p>"{translations["t_text"]}"</p>', html)
-
-    def test_generate_testimonials_html_empty(self):
-        """Test testimonials HTML generation with no items."""
-        html = self.testimonials_generator.generate_html([], self.en_translations)
-        self.assertEqual(html.strip(), "")
+    def test_generate_list_html(self):
+        """Test list-based generators render their items' translated fields."""
+        for generator_attr, items, translations, expected in _LIST_GENERATOR_CASES:
+            with self.subTest(generator=generator_attr):
+                generator = getattr(self, generator_attr)
+                html = generator.generate_html(items, translations)
+                for fragment in expected:
+                    self.assertIn(fragment, html)
+
+    def test_generate_list_html_empty(self):
+        """Test list-based generators render nothing when given no items."""
+        for generator_attr, _, _, _ in _LIST_GENERATOR_CASES:
+            with self.subTest(generator=generator_attr):
+                generator = getattr(self, generator_attr)
+                html = generator.generate_html([], self.en_translations)
+                self.assertEqual(html.strip(), "")
+
+    def test_generate_html_reuses_compiled_template(self):
+        """Test that a generator loads its template once and reuses it."""
+        items = [_FEATURE_ITEM]
+        with mock.patch.object(
+            self.jinja_env, "get_template", wraps=self.jinja_env.get_template
+        ) as mock_get_template:
+            first = self.features_generator.generate_html(items, self.en_translations)
+            second = self.features_generator.generate_html(items, self.es_translations)
+        mock_get_template.assert_called_once_with("blocks/features.html")
+        self.assertIn(self.en_translations["feature_title_1"], first)
+        self.assertIn(self.es_translations["feature_title_1"], second)
 
     def test_generate_hero_html(self):
         """Test generation of hero HTML with HeroHtmlGenerator."""
-        hero_item_instance = HeroItem()
-        json_format.ParseDict(self.hero_item_data, hero_item_instance)
         translations = self.en_translations  # Use full translations from setUp
 
-        with mock.patch(
-            "build_protocols.html_generation.random.choice", side_effect=lambda x: x[0]
-        ):
-            html = self.hero_generator.generate_html(hero_item_instance, translations)
+        hero_generator = HeroHtmlGenerator(
+            jinja_env=self.jinja_env, choose=lambda variations: variations[0]
+        )
+        html = hero_generator.generate_html(_HERO_ITEM, translations)
 
         # Check against keys from self.en_translations
         self.assertIn(f"<h1>{translations['hero_title_main_v1']}</h1>", html)
@@ -746,118 +882,128 @@ class TestBuildScript(unittest.TestCase):
             html,
         )
         self.assertIn(
-            f"<!-- Selected variation: {hero_item_instance.variations[0].variation_id} -->",  # type: ignore
+            f"<!-- Selected variation: {_HERO_ITEM.variations[0].variation_id} -->",  # type: ignore
             html,
         )
 
+    def test_generate_hero_html_without_default_variation(self):
+        """Test that the injected chooser picks the variation without a default."""
+        hero_generator = HeroHtmlGenerator(
+            jinja_env=self.jinja_env, choose=lambda variations: variations[-1]
+        )
+        html = hero_generator.generate_html(
+            _HERO_ITEM_WITHOUT_DEFAULT, self.en_translations
+        )
+        self.assertIn(f"<h1>{self.en_translations['hero_title_main_v2']}</h1>", html)
+        self.assertIn("<!-- Selected variation: var2 -->", html)
+
     def test_generate_hero_html_none_item(self):
         """Test hero HTML generation when item is None."""
         html = self.hero_generator.generate_html(None, self.en_translations)
         self.assertEqual(html.strip(), "<!-- Hero data not found or no variations -->")
 
-    @mock.patch("build.DefaultAppConfigManager.load_app_config")
-    @mock.patch("build.DefaultTranslationProvider.load_translations")
-    @mock.patch("build.DefaultTranslationProvider.translate_html_content")
-    @mock.patch("build.JsonProtoDataLoader.load_dynamic_list_data")
-    @mock.patch("build.JsonProtoDataLoader.load_dynamic_single_item_data")
-    @mock.patch("build.InMemoryDataCache.preload_data")
-    @mock.patch("build.InMemoryDataCache.get_item")
-    @mock.patch("build.DefaultAppConfigManager.generate_language_config")
-    # @mock.patch("build.DefaultPageBuilder.extract_base_html_parts") # This method is no longer used directly by the orchestrator
-    @mock.patch("build.DefaultPageBuilder.assemble_translated_page")
-    @mock.patch("build_protocols.html_generation.PortfolioHtmlGenerator.generate_html")
-    @mock.patch("build_protocols.html_generation.BlogHtmlGenerator.generate_html")
-    @mock.patch("build_protocols.html_generation.FeaturesHtmlGenerator.generate_html")
-    @mock.patch(
-        "build_protocols.html_generation.TestimonialsHtmlGenerator.generate_html"
-    )
-    @mock.patch("build_protocols.html_generation.HeroHtmlGenerator.generate_html")
-    @mock.patch(
-        "build_protocols.html_generation.ContactFormHtmlGenerator.generate_html"
-    )
-    @mock.patch("builtins.open", new_callable=mock.mock_open)
-    def test_main_function_creates_files(
-        self,
-        mock_builtin_open,
-        mock_gen_contact_html,
-        mock_gen_hero_html,
-        mock_gen_testimonials_html,
-        mock_gen_features_html,
-        mock_gen_blog_html,
-        mock_gen_portfolio_html,
-        mock_assemble_page,
-        # mock_extract_parts, # Removed as the method is no longer patched
-        mock_generate_lang_config,
-        mock_data_cache_get_item,
-        mock_data_cache_preload,
-        mock_load_single_item_data,
-        mock_load_list_data,
-        mock_translate_content,
-        mock_load_translations,
-        mock_load_app_config,
-    ):
+    def test_assemble_translated_page_reuses_base_template(self):
+        """Test that DefaultPageBuilder loads base.html once across languages."""
+        base_template_path = os.path.join(self.test_root_dir, "templates", "base.html")
+        self.addCleanup(os.remove, base_template_path)
+        with open(base_template_path, "w", encoding="utf-8") as f:
+            f.write('<html lang="{{ lang }}"><main>{{ main_content }}</main></html>')
+        page_builder = DefaultPageBuilder(
+            translation_provider=self.translation_provider, jinja_env=self.jinja_env
+        )
+        with mock.patch.object(
+            self.jinja_env, "get_template", wraps=self.jinja_env.get_template
+        ) as mock_get_template:
+            html_en = page_builder.assemble_translated_page(
+                "en", self.en_translations, "<p>EN</p>"
+            )
+            html_es = page_builder.assemble_translated_page(
+                "es", self.es_translations, "<p>ES</p>"
+            )
+        mock_get_template.assert_called_once_with("base.html")
+        self.assertIn('<html lang="en">', html_en)
+        self.assertIn("<p>ES</p>", html_es)
+
+    def test_main_function_creates_files(self):
         """Test that build_main (via BuildOrchestrator) creates output files."""
+        patches = contextlib.ExitStack()
+        self.addCleanup(patches.close)
+
+        def patch(target: str, **kwargs: Any) -> mock.MagicMock:
+            mocked: mock.MagicMock = patches.enter_context(mock.patch(target, **kwargs))
+            return mocked
+
+        mock_load_app_config = patch("build.DefaultAppConfigManager.load_app_config")
+        mock_load_translations = patch(
+            "build.DefaultTranslationProvider.load_translations"
+        )
+        mock_translate_content = patch(
+            "build.DefaultTranslationProvider.translate_html_content"
+        )
+        mock_load_list_data = patch("build.JsonProtoDataLoader.load_dynamic_list_data")
+        mock_load_single_item_data = patch(
+            "build.JsonProtoDataLoader.load_dynamic_single_item_data"
+        )
+        mock_data_cache_preload = patch("build.InMemoryDataCache.preload_data")
+        mock_data_cache_get_item = patch("build.InMemoryDataCache.get_item")
+        mock_generate_lang_config = patch(
+            "build.DefaultAppConfigManager.generate_language_config"
+        )
+        mock_assemble_page = patch("build.DefaultPageBuilder.assemble_translated_page")
+        generators = "build_protocols.html_generation"
+        mock_gen_portfolio_html = patch(
+            f"{generators}.PortfolioHtmlGenerator.generate_html"
+        )
+        mock_gen_blog_html = patch(f"{generators}.BlogHtmlGenerator.generate_html")
+        mock_gen_features_html = patch(
+            f"{generators}.FeaturesHtmlGenerator.generate_html"
+        )
+        mock_gen_testimonials_html = patch(
+            f"{generators}.TestimonialsHtmlGenerator.generate_html"
+        )
+        mock_gen_hero_html = patch(f"{generators}.HeroHtmlGenerator.generate_html")
+        mock_gen_contact_html = patch(
+            f"{generators}.ContactFormHtmlGenerator.generate_html"
+        )
+
         mock_load_app_config.return_value = self.dummy_config
-        mock_load_translations.side_effect = lambda lang: (
-            self.en_translations if lang == "en" else self.es_translations
+        translations_by_lang = {"en": self.en_translations, "es": self.es_translations}
+        mock_load_translations.side_effect = lambda lang: translations_by_lang.get(
+            lang, {}
         )
         mock_translate_content.side_effect = lambda content, translations: content
 
-        mock_portfolio_item = PortfolioItem(id="p1", details={"title": {"key": "ptk"}})
-        mock_blog_post = BlogPost(id="b1", title={"key": "btk"})
-        mock_feature_item = FeatureItem(content={"title": {"key": "ftk"}})
-        mock_testimonial_item = TestimonialItem(text={"key": "ttk"})
-        mock_hero_item = HeroItem(
-            default_variation_id="v1",
-            variations=[HeroItemContent(variation_id="v1", title={"key": "htk"})],
-        )  # type: ignore
-        mock_contact_config = ContactFormConfig(
-            form_action_uri="/test_action",
-            success_message_key="contact_success",
-            error_message_key="contact_error",
-        )
-        mock_navigation_data = Navigation()
-
         def load_list_data_side_effect(data_file_path, message_type):
-            if "portfolio" in data_file_path:
-                return [mock_portfolio_item]
-            if "blog" in data_file_path:
-                return [mock_blog_post]
-            if "features" in data_file_path:
-                return [mock_feature_item]
-            if "testimonials" in data_file_path:
-                return [mock_testimonial_item]
-            return []
+            return next(
+                (
+                    items
+                    for name, items in _MAIN_LIST_ITEMS.items()
+                    if name in data_file_path
+                ),
+                [],
+            )
 
         mock_load_list_data.side_effect = load_list_data_side_effect
 
         def load_single_item_data_side_effect(data_file_path, message_type):
-            if "hero" in data_file_path:
-                return mock_hero_item
-            if "contact_form" in data_file_path:
-                return mock_contact_config
-            # Check basename as data_file_path might be absolute in tests
-            if os.path.basename(data_file_path) == "navigation.json":
-                return mock_navigation_data
-            return None
+            return next(
+                (
+                    item
+                    for name, item in _MAIN_SINGLE_ITEMS.items()
+                    if name in data_file_path
+                ),
+                None,
+            )
 
         mock_load_single_item_data.side_effect = load_single_item_data_side_effect
 
         mock_data_cache_preload.return_value = None
 
         def data_cache_get_item_side_effect(key):
-            if "portfolio" in key:
-                return [mock_portfolio_item]
-            if "blog" in key:
-                return [mock_blog_post]
-            if "features" in key:
-                return [mock_feature_item]
-            if "testimonials" in key:
-                return [mock_testimonial_item]
-            if "hero" in key:
-                return mock_hero_item
-            if "contact_form" in key:
-                return mock_contact_config
+            for table in (_MAIN_LIST_ITEMS, _MAIN_SINGLE_ITEMS):
+                for name, data in table.items():
+                    if name in key:
+                        return data
             return None
 
         mock_data_cache_get_item.side_effect = data_cache_get_item_side_effect
@@ -873,19 +1019,6 @@ class TestBuildScript(unittest.TestCase):
             "ui_strings": {},
         }
 
-        header_match = re.search(
-            r"<header.*?>(.*?)<\/header>",
-            self.dummy_index_content,
-            re.DOTALL,
-        )
-        footer_match = re.search(
-            r"<footer.*?>(.*?)<\/footer>",
-            self.dummy_index_content,
-            re.DOTALL,
-        )
-        _ = header_match.group(0) if header_match else "<header></header>"
-        _ = footer_match.group(0) if footer_match else "<footer></footer>"
-
         # mock_extract_parts.return_value = ( # No longer needed as the function is not called
         #     "<html><head_content/></head><body>",
         #     dummy_header_content,
@@ -896,91 +1029,43 @@ class TestBuildScript(unittest.TestCase):
             "<html><body>Assembled Page Content</body></html>"
         )
 
+        root_dir = self._create_root_dir()
+
+        # Key the registry by absolute path once, so each read is a dict lookup
+        # rather than an os.path.relpath() call.
+        contents_by_path = {
+            os.path.join(root_dir, path): content
+            for path, content in self.file_registry.items()
+        }
+
         def mock_builtin_open_side_effect(filename, mode="r", *args, **kwargs):
-            normalized_filename = os.path.normpath(filename)
-            if mode == "r":
-                if normalized_filename.startswith(os.path.join("blocks")):
-                    block_name = os.path.basename(filename)
-                    placeholder_map = {
-                        "hero.html": "{{hero_content}}",
-                        "features.html": "{{feature_items}}",
-                        "testimonials.html": "{{testimonial_items}}",
-                        "portfolio.html": "{{portfolio_items}}",
-                        "blog.html": "{{blog_posts}}",
-                        "contact-form.html": "{{contact_form_attributes}}",
-                    }
-                    return mock.mock_open(
-                        read_data=(f"<div>{placeholder_map.get(block_name, '')}</div>")
-                    ).return_value
-                if normalized_filename == "index.html":
-                    return mock.mock_open(
-                        read_data=self.dummy_index_content
-                    ).return_value
-                if normalized_filename == os.path.join("public", "config.json"):
-                    return mock.mock_open(
-                        read_data=json.dumps(self.dummy_config)
-                    ).return_value
-                if normalized_filename == os.path.normpath(
-                    os.path.join("public", "locales", "en.json")
-                ):
-                    return mock.mock_open(
-                        read_data=json.dumps(self.en_translations)
-                    ).return_value
-                if normalized_filename == os.path.normpath(
-                    os.path.join("public", "locales", "es.json")
-                ):
-                    return mock.mock_open(
-                        read_data=json.dumps(self.es_translations)
-                    ).return_value
-                if normalized_filename == os.path.normpath(
-                    os.path.join("data", "navigation.json")
-                ):
-                    return mock.mock_open(
-                        read_data=json.dumps({"items": []})
-                    ).return_value
-            elif mode == "w":
-                return mock.MagicMock()
-            return mock.mock_open(read_data="").return_value
-
-        mock_builtin_open.side_effect = mock_builtin_open_side_effect
-
-        build_main()
-
-        expected_paths = [
+            if mode == "w":
+                return io.StringIO()
+            return io.StringIO(contents_by_path.get(os.path.normpath(filename), ""))
+
+        # A plain mock is enough: every call is answered by the side effect, so
+        # the handle tree mock.mock_open would build is never used. The patch
+        # only covers the build, so the assertions below run with the real open.
+        with mock.patch(
+            "builtins.open", side_effect=mock_builtin_open_side_effect
+        ) as mock_builtin_open:
+            build_main(root_dir=root_dir)
+
+        expected_paths = {
             os.path.join("public", "generated_configs", "config_en.json"),
             "index.html",
             os.path.join("public", "generated_configs", "config_es.json"),
             "index_es.html",
-        ]
-        expected_write_calls = [
-            mock.call(os.path.normpath(p), "w", encoding="utf-8")
-            for p in expected_paths
-        ]
-
-        actual_write_calls = [
-            c for c in mock_builtin_open.call_args_list if c.args[1] == "w"
-        ]
+        }
+        write_calls = [c for c in mock_builtin_open.call_args_list if c.args[1] == "w"]
 
+        # Every output, and nothing else, is opened for writing as UTF-8 under
+        # the project root.
         self.assertEqual(
-            len(actual_write_calls),
-            len(expected_write_calls),
-            "Number of write calls does not match.",
+            {(c.args[0], c.kwargs.get("encoding")) for c in write_calls},
+            {(os.path.join(root_dir, path), "utf-8") for path in expected_paths},
         )
 
-        for expected_call in expected_write_calls:
-            normalized_actual_calls = [
-                mock.call(os.path.normpath(c.args[0]), *c.args[1:], **c.kwargs)
-                for c in actual_write_calls
-            ]
-            self.assertIn(
-                expected_call,
-                normalized_actual_calls,
-                (
-                    f"Expected write call not found: {expected_call}\n"
-                    f"Actual write calls: {actual_write_calls}"
-                ),
-            )
-
         mock_load_app_config.assert_called_once()
         self.assertEqual(mock_load_translations.call_count, 2)
         mock_data_cache_preload.assert_called_once()
@@ -988,8 +1073,6 @@ class TestBuildScript(unittest.TestCase):
         self.assertEqual(mock_assemble_page.call_count, 2)
         self.assertEqual(mock_generate_lang_config.call_count, 2)
 
-        _ = len(self.dummy_config["supported_langs"])
-
         # Header and Footer are now Jinja includes and handle their own translations.
         # translate_html_content is no longer called for them in _process_language.
         # If other parts of the main flow were to use it, this would need adjustment.
@@ -1007,6 +1090,96 @@ class TestBuildScript(unittest.TestCase):
             f"(excluding calls within Jinja templates), got {mock_translate_content.call_count}",
         )
 
+    def _create_orchestrator_with_mock_services(
+        self, app_config: Dict[str, Any], root_dir: str
+    ) -> BuildOrchestrator:
+        """Creates a BuildOrchestrator whose services are mocks.
+
+        Pages are rendered as `<html lang="...">main content</html>` so tests
+        can inspect what the orchestrator wrote for each language.
+        """
+        app_config_manager = mock.MagicMock()
+        app_config_manager.load_app_config.return_value = app_config
+        app_config_manager.generate_language_config.return_value = {}
+        translation_provider = mock.MagicMock()
+        translation_provider.load_translations.return_value = {}
+        data_loader = mock.MagicMock()
+        data_loader.load_dynamic_single_item_data.return_value = None
+        page_builder = mock.MagicMock()
+        page_builder.assemble_translated_page.side_effect = (
+            lambda lang, main_content, **kwargs: (
+                f'<html lang="{lang}">{main_content}</html>'
+            )
+        )
+        return BuildOrchestrator(
+            app_config_manager=app_config_manager,
+            translation_provider=translation_provider,
+            data_loader=data_loader,
+            data_cache=mock.MagicMock(),
+            page_builder=page_builder,
+            html_generators={},
+            root_dir=root_dir,
+        )
+
+    def _create_root_dir(self) -> str:
+        """Creates an empty per-test project root for builds that write output.
+
+        The root is unique to the test and lives in the fake filesystem, which
+        pyfakefs discards after the class, so it needs no explicit cleanup.
+        """
+        return tempfile.mkdtemp()
+
+    def test_build_all_languages_reads_static_blocks_once(self):
+        """Test that a static block is read once and reused for every language."""
+        root_dir = self._create_root_dir()
+        static_block_path = os.path.join(root_dir, "templates", "blocks", "static.html")
+        os.makedirs(os.path.dirname(static_block_path))
+        with open(static_block_path, "w", encoding="utf-8") as f:
+            f.write("<p>Static</p>")
+        orchestrator = self._create_orchestrator_with_mock_services(
+            {
+                "blocks": ["static.html"],
+                "supported_langs": ["en", "es"],
+                "default_lang": "en",
+            },
+            root_dir,
+        )
+
+        with mock.patch("builtins.open", wraps=open) as mock_file_open:
+            orchestrator.build_all_languages()
+
+        static_block_reads = [
+            c for c in mock_file_open.call_args_list if c.args[0] == static_block_path
+        ]
+        self.assertEqual(len(static_block_reads), 1)
+        for filename in ("index.html", "index_es.html"):
+            with open(os.path.join(root_dir, filename), "r", encoding="utf-8") as f:
+                self.assertIn("<p>Static</p>", f.read())
+
+    def test_build_all_languages_rereads_static_blocks_on_rebuild(self):
+        """Test that a second build picks up an edited static block."""
+        root_dir = self._create_root_dir()
+        static_block_path = os.path.join(root_dir, "templates", "blocks", "static.html")
+        os.makedirs(os.path.dirname(static_block_path))
+        with open(static_block_path, "w", encoding="utf-8") as f:
+            f.write("<p>Before</p>")
+        orchestrator = self._create_orchestrator_with_mock_services(
+            {
+                "blocks": ["static.html"],
+                "supported_langs": ["en"],
+                "default_lang": "en",
+            },
+            root_dir,
+        )
+
+        orchestrator.build_all_languages()
+        with open(static_block_path, "w", encoding="utf-8") as f:
+            f.write("<p>After</p>")
+        orchestrator.build_all_languages()
+
+        with open(os.path.join(root_dir, "index.html"), "r", encoding="utf-8") as f:
+            self.assertIn("<p>After</p>", f.read())
+
 
 if __name__ == "__main__":
     unittest.main()